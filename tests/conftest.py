@@ -2,23 +2,70 @@
 pytest configuration and shared fixtures for Adaptive Claude Agents tests.
 
 This module provides:
-- Temporary project fixtures for all supported frameworks
+- Session-scoped, read-only project fixtures for all supported frameworks
+  (with writable *_project_mutable copies for tests that modify them)
 - Common test utilities
 - pytest configuration
 """
 
 import pytest
+import contextlib
+import functools
+import io
 import json
+import logging
+import os
+import runpy
+import subprocess
+import sys
+import traceback
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Union
 
 
 # ============================================================================
 # pytest Configuration
 # ============================================================================
 
+def pytest_addoption(parser):
+    """Register command-line options."""
+    parser.addoption(
+        "--run-bench",
+        action="store_true",
+        default=False,
+        help="run tests that use the benchmark fixture (also enabled by RUN_BENCH=1)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmark-fixture tests unless benchmarks were explicitly requested."""
+    if (
+        config.getoption("--run-bench")
+        or os.environ.get("RUN_BENCH") == "1"
+        or config.getoption("benchmark_only", default=False)
+    ):
+        return
+
+    skip_bench = pytest.mark.skip(reason="benchmark: use --run-bench or RUN_BENCH=1")
+    for item in items:
+        if "benchmark" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip_bench)
+
+
+# RAM-backed scratch space for fixture trees on Linux. Used as pytest's temp
+# root (not --basetemp, which is wiped on startup and would clobber a
+# concurrent run), so each run still gets its own numbered, locked
+# pytest-N directory -- just on tmpfs. An explicit --basetemp or
+# PYTEST_DEBUG_TEMPROOT in the environment always wins.
+_TMPFS_ROOT = Path("/dev/shm")
+
+
+@pytest.hookimpl(tryfirst=True)
 def pytest_configure(config):
-    """Configure pytest with custom markers."""
+    """Configure pytest with custom markers and a tmpfs-backed temp root."""
+    if _TMPFS_ROOT.is_dir() and os.access(_TMPFS_ROOT, os.W_OK):
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", str(_TMPFS_ROOT))
+
     config.addinivalue_line(
         "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
     )
@@ -28,6 +75,11 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "integration: marks end-to-end integration tests"
     )
+    # Normally registered by pytest-xdist; repeated here so --strict-markers
+    # still accepts it when the suite runs without the plugin
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests sharing a name on the same xdist worker"
+    )
 
 
 # ============================================================================
@@ -89,15 +141,53 @@ dependencies:
     return path
 
 
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+
+
+def write_files(root: Path, files: Dict[str, Union[str, bytes]]) -> Path:
+    """Create root and write each relative path -> content pair under it.
+
+    Contents are encoded up front and written with raw os.open/os.write,
+    skipping the TextIOWrapper that Path.write_text sets up per file.
+    """
+    payloads = {
+        os.path.join(root, rel_path): content.encode("utf-8") if isinstance(content, str) else content
+        for rel_path, content in files.items()
+    }
+    os.makedirs(root, exist_ok=True)
+    for path, data in payloads.items():
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd = os.open(path, _WRITE_FLAGS, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+    return root
+
+
+def fast_read_text(path: Path) -> str:
+    """Read a UTF-8 file with one open/fstat/read, without buffered IO."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    try:
+        return os.read(fd, os.fstat(fd).st_size).decode("utf-8")
+    finally:
+        os.close(fd)
+
+
+def mkdirs(root: Path, *rel_dirs: str) -> None:
+    """Create (possibly nested) empty directories under root."""
+    for rel_dir in rel_dirs:
+        os.makedirs(os.path.join(root, rel_dir), exist_ok=True)
+
+
 # ============================================================================
 # Next.js Fixtures
 # ============================================================================
 
-@pytest.fixture
-def nextjs_project(tmp_path):
+@pytest.fixture(scope="session")
+def nextjs_project(tmp_path_factory):
     """Create minimal Next.js project for testing."""
-    project = tmp_path / "nextjs-demo"
-    project.mkdir()
+    project = tmp_path_factory.mktemp("nextjs-demo", numbered=False)
 
     # package.json
     create_package_json(project, "test-nextjs", {
@@ -142,11 +232,10 @@ export default function RootLayout({
 # FastAPI Fixtures
 # ============================================================================
 
-@pytest.fixture
-def fastapi_project(tmp_path):
+@pytest.fixture(scope="session")
+def fastapi_project(tmp_path_factory):
     """Create minimal FastAPI project for testing."""
-    project = tmp_path / "fastapi-demo"
-    project.mkdir()
+    project = tmp_path_factory.mktemp("fastapi-demo", numbered=False)
 
     # main.py
     (project / "main.py").write_text('''from fastapi import FastAPI
@@ -186,11 +275,10 @@ dependencies = [
 # Go Fixtures
 # ============================================================================
 
-@pytest.fixture
-def go_project(tmp_path):
+@pytest.fixture(scope="session")
+def go_project(tmp_path_factory):
     """Create minimal Go project for testing."""
-    project = tmp_path / "go-demo"
-    project.mkdir()
+    project = tmp_path_factory.mktemp("go-demo", numbered=False)
 
     # go.mod
     create_go_mod(project, "github.com/example/test-go", {
@@ -222,11 +310,10 @@ func main() {
 # Flutter Fixtures
 # ============================================================================
 
-@pytest.fixture
-def flutter_project(tmp_path):
+@pytest.fixture(scope="session")
+def flutter_project(tmp_path_factory):
     """Create minimal Flutter project for testing."""
-    project = tmp_path / "flutter-demo"
-    project.mkdir()
+    project = tmp_path_factory.mktemp("flutter-demo", numbered=False)
 
     # pubspec.yaml
     create_pubspec_yaml(project, "test_flutter", {
@@ -259,8 +346,7 @@ class MyApp extends StatelessWidget {
 ''')
 
     # Create android/ and ios/ directories (minimal)
-    (project / "android").mkdir()
-    (project / "ios").mkdir()
+    mkdirs(project, "android", "ios")
 
     return project
 
@@ -269,11 +355,10 @@ class MyApp extends StatelessWidget {
 # React (Vite) Fixtures
 # ============================================================================
 
-@pytest.fixture
-def react_project(tmp_path):
+@pytest.fixture(scope="session")
+def react_project(tmp_path_factory):
     """Create minimal React (Vite) project for testing."""
-    project = tmp_path / "react-demo"
-    project.mkdir()
+    project = tmp_path_factory.mktemp("react-demo", numbered=False)
 
     # package.json
     create_package_json(project, "test-react", {
@@ -320,11 +405,10 @@ ReactDOM.createRoot(document.getElementById('root')).render(
 # Vue Fixtures
 # ============================================================================
 
-@pytest.fixture
-def vue_project(tmp_path):
+@pytest.fixture(scope="session")
+def vue_project(tmp_path_factory):
     """Create minimal Vue project for testing."""
-    project = tmp_path / "vue-demo"
-    project.mkdir()
+    project = tmp_path_factory.mktemp("vue-demo", numbered=False)
 
     # package.json
     create_package_json(project, "test-vue", {
@@ -368,11 +452,10 @@ export default {
 # Django Fixtures
 # ============================================================================
 
-@pytest.fixture
-def django_project(tmp_path):
+@pytest.fixture(scope="session")
+def django_project(tmp_path_factory):
     """Create minimal Django project for testing."""
-    project = tmp_path / "django-demo"
-    project.mkdir()
+    project = tmp_path_factory.mktemp("django-demo", numbered=False)
 
     # requirements.txt
     create_requirements_txt(project, [
@@ -408,11 +491,10 @@ INSTALLED_APPS = ['django.contrib.contenttypes']
 # Flask Fixtures
 # ============================================================================
 
-@pytest.fixture
-def flask_project(tmp_path):
+@pytest.fixture(scope="session")
+def flask_project(tmp_path_factory):
     """Create minimal Flask project for testing."""
-    project = tmp_path / "flask-demo"
-    project.mkdir()
+    project = tmp_path_factory.mktemp("flask-demo", numbered=False)
 
     # requirements.txt
     create_requirements_txt(project, [
@@ -444,11 +526,10 @@ if __name__ == '__main__':
 # Python ML/CV Fixtures
 # ============================================================================
 
-@pytest.fixture
-def python_ml_project(tmp_path):
+@pytest.fixture(scope="session")
+def python_ml_project(tmp_path_factory):
     """Create minimal Python ML/CV project for testing."""
-    project = tmp_path / "python-ml-demo"
-    project.mkdir()
+    project = tmp_path_factory.mktemp("python-ml-demo", numbered=False)
 
     # requirements.txt
     create_requirements_txt(project, [
@@ -494,11 +575,10 @@ def detect_objects(image_path):
 # iOS Swift Fixtures
 # ============================================================================
 
-@pytest.fixture
-def ios_swift_project(tmp_path):
+@pytest.fixture(scope="session")
+def ios_swift_project(tmp_path_factory):
     """Create minimal iOS Swift project for testing."""
-    project = tmp_path / "ios-swift-demo"
-    project.mkdir()
+    project = tmp_path_factory.mktemp("ios-swift-demo", numbered=False)
 
     # Create .xcodeproj directory (Xcode project structure)
     xcodeproj = project / "ios-swift-demo.xcodeproj"
@@ -545,11 +625,10 @@ struct ContentView: View {
 # Vanilla PHP Fixtures
 # ============================================================================
 
-@pytest.fixture
-def php_project(tmp_path):
+@pytest.fixture(scope="session")
+def php_project(tmp_path_factory):
     """Create minimal Vanilla PHP project for testing."""
-    project = tmp_path / "php-demo"
-    project.mkdir()
+    project = tmp_path_factory.mktemp("php-demo", numbered=False)
 
     # composer.json
     (project / "composer.json").write_text(json.dumps({
@@ -589,15 +668,92 @@ RewriteRule ^(.*)$ index.php [QSA,L]
     return project
 
 
+@pytest.fixture(scope="session")
+def all_projects(
+    nextjs_project,
+    fastapi_project,
+    go_project,
+    flutter_project,
+    react_project,
+    vue_project,
+    django_project,
+    flask_project,
+    python_ml_project,
+    ios_swift_project,
+    php_project,
+) -> Dict[str, Path]:
+    """Fixture mapping each *_project fixture name to its shared project path."""
+    return {
+        "nextjs_project": nextjs_project,
+        "fastapi_project": fastapi_project,
+        "go_project": go_project,
+        "flutter_project": flutter_project,
+        "react_project": react_project,
+        "vue_project": vue_project,
+        "django_project": django_project,
+        "flask_project": flask_project,
+        "python_ml_project": python_ml_project,
+        "ios_swift_project": ios_swift_project,
+        "php_project": php_project,
+    }
+
+
 # ============================================================================
-# Monorepo Fixtures
+# Writable Project Copies
 # ============================================================================
+# The *_project fixtures above are session-scoped and shared by every test,
+# so they must stay read-only. Tests that write into a project (generation,
+# analyze --auto) use these function-scoped copies instead.
+#
+# Copies hardlink their files to the session project (one link() per file,
+# no data copied), so tests may add or replace files but must not rewrite or
+# chmod an existing project file in place.
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hardlink src to dst, falling back to a byte copy (Windows, cross-device)."""
+    import shutil
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _mutable_copy(project: Path, tmp_path: Path) -> Path:
+    """Copy a shared session project into tmp_path."""
+    import shutil
+    return Path(shutil.copytree(project, tmp_path / project.name, copy_function=_link_or_copy))
+
+
+@pytest.fixture
+def nextjs_project_mutable(nextjs_project, tmp_path, detector):
+    """Writable copy of nextjs_project."""
+    yield _mutable_copy(nextjs_project, tmp_path)
+    detector.cache_clear()
+
+
+@pytest.fixture
+def fastapi_project_mutable(fastapi_project, tmp_path, detector):
+    """Writable copy of fastapi_project."""
+    yield _mutable_copy(fastapi_project, tmp_path)
+    detector.cache_clear()
+
 
 @pytest.fixture
-def npm_monorepo(tmp_path, nextjs_project, react_project):
+def go_project_mutable(go_project, tmp_path, detector):
+    """Writable copy of go_project."""
+    yield _mutable_copy(go_project, tmp_path)
+    detector.cache_clear()
+
+
+# ============================================================================
+# Monorepo Fixtures
+# ============================================================================
+# Session-scoped and read-only, like the *_project fixtures they are built from.
+
+@pytest.fixture(scope="session")
+def npm_monorepo(tmp_path_factory, nextjs_project, react_project):
     """Create npm workspaces monorepo with Next.js and React projects."""
-    monorepo = tmp_path / "npm-monorepo"
-    monorepo.mkdir()
+    monorepo = tmp_path_factory.mktemp("npm-monorepo", numbered=False)
 
     # Root package.json with workspaces
     root_pkg = {
@@ -639,11 +795,10 @@ def npm_monorepo(tmp_path, nextjs_project, react_project):
     return monorepo
 
 
-@pytest.fixture
-def pnpm_monorepo(tmp_path, fastapi_project, flask_project):
+@pytest.fixture(scope="session")
+def pnpm_monorepo(tmp_path_factory, fastapi_project, flask_project):
     """Create pnpm workspaces monorepo with FastAPI and Flask projects."""
-    monorepo = tmp_path / "pnpm-monorepo"
-    monorepo.mkdir()
+    monorepo = tmp_path_factory.mktemp("pnpm-monorepo", numbered=False)
 
     # Root package.json (pnpm also needs this)
     root_pkg = {
@@ -688,11 +843,10 @@ def pnpm_monorepo(tmp_path, fastapi_project, flask_project):
     return monorepo
 
 
-@pytest.fixture
-def yarn_monorepo(tmp_path, go_project, flutter_project):
+@pytest.fixture(scope="session")
+def yarn_monorepo(tmp_path_factory, go_project, flutter_project):
     """Create Yarn workspaces monorepo with Go and Flutter projects."""
-    monorepo = tmp_path / "yarn-monorepo"
-    monorepo.mkdir()
+    monorepo = tmp_path_factory.mktemp("yarn-monorepo", numbered=False)
 
     # Root package.json with Yarn workspaces
     root_pkg = {
@@ -735,11 +889,10 @@ def yarn_monorepo(tmp_path, go_project, flutter_project):
     return monorepo
 
 
-@pytest.fixture
-def lerna_monorepo(tmp_path, vue_project, react_project):
+@pytest.fixture(scope="session")
+def lerna_monorepo(tmp_path_factory, vue_project, react_project):
     """Create Lerna monorepo with Vue and React projects."""
-    monorepo = tmp_path / "lerna-monorepo"
-    monorepo.mkdir()
+    monorepo = tmp_path_factory.mktemp("lerna-monorepo", numbered=False)
 
     # lerna.json
     lerna_config = {
@@ -778,11 +931,10 @@ def lerna_monorepo(tmp_path, vue_project, react_project):
     return monorepo
 
 
-@pytest.fixture
-def nx_monorepo(tmp_path, nextjs_project, fastapi_project):
+@pytest.fixture(scope="session")
+def nx_monorepo(tmp_path_factory, nextjs_project, fastapi_project):
     """Create Nx monorepo with Next.js and FastAPI projects."""
-    monorepo = tmp_path / "nx-monorepo"
-    monorepo.mkdir()
+    monorepo = tmp_path_factory.mktemp("nx-monorepo", numbered=False)
 
     # nx.json
     nx_config = {
@@ -854,14 +1006,13 @@ def nx_monorepo(tmp_path, nextjs_project, fastapi_project):
     return monorepo
 
 
-@pytest.fixture
-def nested_monorepo(tmp_path, npm_monorepo):
+@pytest.fixture(scope="session")
+def nested_monorepo(tmp_path_factory, npm_monorepo):
     """Create nested monorepo structure (monorepo within monorepo)."""
     # This tests edge case of nested workspace structures
     import shutil
 
-    outer_monorepo = tmp_path / "nested-monorepo"
-    outer_monorepo.mkdir()
+    outer_monorepo = tmp_path_factory.mktemp("nested-monorepo", numbered=False)
 
     # Outer package.json with workspaces
     root_pkg = {
@@ -892,7 +1043,7 @@ def nested_monorepo(tmp_path, npm_monorepo):
 @pytest.fixture
 def analyzer_factory():
     """Factory fixture for creating ProjectAnalyzer instances."""
-    from skills.project_analyzer.analyze_project import ProjectAnalyzer
+    from analyze_project import ProjectAnalyzer
 
     def _create_analyzer(project_path: Path, auto_confirm: bool = True):
         return ProjectAnalyzer(project_path, auto_confirm=auto_confirm)
@@ -900,31 +1051,212 @@ def analyzer_factory():
     return _create_analyzer
 
 
-@pytest.fixture
+def _content_key(path) -> tuple:
+    """(relpath, st_size, st_mtime_ns) of every entry under path, from os.lstat.
+
+    Nothing is opened or read, so dangling symlinks and unreadable files
+    (which detect_tech_stack tolerates) can't make the key itself fail;
+    entries that can't even be lstat'ed are recorded by name only.
+    """
+    entries = []
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in dirs + sorted(files):
+            full = os.path.join(root, name)
+            try:
+                st = os.lstat(full)
+            except OSError:
+                entries.append((os.path.relpath(full, path), None, None))
+                continue
+            entries.append((os.path.relpath(full, path), st.st_size, st.st_mtime_ns))
+    return tuple(entries)
+
+
+# Set DETECTOR_CACHE=0 to make the detector fixture run every detection
+# (e.g. when debugging detect_stack itself)
+_DETECTOR_CACHE = os.environ.get("DETECTOR_CACHE", "1") != "0"
+
+
+@pytest.fixture(scope="session")
 def detector():
-    """Fixture providing detect_tech_stack function."""
-    import sys
-    from pathlib import Path
+    """Fixture providing detect_tech_stack, memoized per project path and content.
+
+    Results are keyed on the path (DetectionResult.used_files holds absolute
+    paths) and the size and mtime of every file and directory under it, so
+    any change anywhere in the tree forces a fresh detection. Fixtures that hand
+    out writable trees still call detector.cache_clear() on teardown to drop
+    their entries. Use uncached_detector when the detection itself is what
+    is being measured.
+    """
+    from detect_stack import detect_tech_stack
 
-    # Add skills directory to Python path
-    skills_dir = Path(__file__).parent.parent / "skills" / "project-analyzer"
-    if str(skills_dir) not in sys.path:
-        sys.path.insert(0, str(skills_dir))
+    @functools.lru_cache(maxsize=128)
+    def _detect(path, content_key: tuple):
+        return detect_tech_stack(path)
 
+    def detect(path):
+        if not _DETECTOR_CACHE:
+            return detect_tech_stack(path)
+        return _detect(path, _content_key(path))
+
+    detect.cache_clear = _detect.cache_clear
+    return detect
+
+
+@pytest.fixture(scope="session")
+def _warm_detector(tmp_path_factory):
+    """Run one throwaway detection so no timed test pays the detect_stack import."""
     from detect_stack import detect_tech_stack
-    return detect_tech_stack
+
+    project = write_files(tmp_path_factory.mktemp("warmup"), {"package.json": b'{"name":"warmup"}'})
+    detect_tech_stack(str(project), use_cache=False)
+
+
+@pytest.fixture(scope="session")
+def uncached_detector(_warm_detector):
+    """Fixture providing detect_tech_stack with the on-disk DetectionCache off (for benchmarks)."""
+    from detect_stack import detect_tech_stack
+    return functools.partial(detect_tech_stack, use_cache=False)
+
+
+@pytest.fixture
+def project_factory(tmp_path):
+    """Fixture providing a builder for ad-hoc projects: build(name, files, dirs=()) -> Path."""
+    def build(name: str, files: Dict[str, Union[str, bytes]], dirs: tuple = ()) -> Path:
+        project = write_files(tmp_path / name, files)
+        mkdirs(project, *dirs)
+        return project
+    return build
+
+
+@pytest.fixture(scope="session")
+def shared_project_factory(tmp_path_factory):
+    """Session-scoped project_factory: each named tree is built once and reused.
+
+    Trees are shared by every test that builds the same name, so they must
+    stay read-only; reusing a name with different contents is an error.
+    """
+    built = {}
+
+    def build(name: str, files: Dict[str, Union[str, bytes]], dirs: tuple = ()) -> Path:
+        if name in built:
+            project, spec = built[name]
+            if spec != (files, tuple(dirs)):
+                raise ValueError(f"shared project {name!r} rebuilt with different contents")
+            return project
+        project = write_files(tmp_path_factory.mktemp(name), files)
+        mkdirs(project, *dirs)
+        built[name] = (project, (files, tuple(dirs)))
+        return project
+    return build
+
+
+@pytest.fixture
+def agents_dir(tmp_path):
+    """Fixture providing an empty tmp_path/.claude/agents directory."""
+    path = tmp_path / ".claude" / "agents"
+    os.makedirs(path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def read_text():
+    """Fixture providing fast_read_text(path) -> str (raises FileNotFoundError)."""
+    return fast_read_text
+
+
+@pytest.fixture(scope="session")
+def nextjs_detection(nextjs_project, detector):
+    """Fixture providing a precomputed DetectionResult for nextjs_project."""
+    return detector(str(nextjs_project))
+
+
+@pytest.fixture(scope="session")
+def fastapi_detection(fastapi_project, detector):
+    """Fixture providing a precomputed DetectionResult for fastapi_project."""
+    return detector(str(fastapi_project))
+
+
+@pytest.fixture(scope="session")
+def go_detection(go_project, detector):
+    """Fixture providing a precomputed DetectionResult for go_project."""
+    return detector(str(go_project))
 
 
 @pytest.fixture
 def monorepo_detector():
     """Fixture providing MonorepoDetector class."""
-    import sys
-    from pathlib import Path
+    from detect_monorepo import MonorepoDetector
+    return MonorepoDetector
 
-    # Add skills directory to Python path
-    skills_dir = Path(__file__).parent.parent / "skills" / "project-analyzer"
-    if str(skills_dir) not in sys.path:
-        sys.path.insert(0, str(skills_dir))
 
+@pytest.fixture(scope="session")
+def cached_monorepo_detector():
+    """Fixture providing detect(path) -> MonorepoResult, memoized per tree.
+
+    Results are keyed on the path and the mtime of its package.json, so
+    tests sharing a monorepo fixture walk it once. Results are shared and
+    must not be mutated; tests that patch detect_monorepo (e.g. YAML
+    availability) need the uncached monorepo_detector.
+    """
     from detect_monorepo import MonorepoDetector
-    return MonorepoDetector
+
+    @functools.lru_cache(maxsize=64)
+    def _detect(path: str, package_json_mtime_ns):
+        return MonorepoDetector(path).detect()
+
+    def detect(path):
+        try:
+            mtime_ns = os.stat(os.path.join(path, "package.json")).st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+        return _detect(str(path), mtime_ns)
+
+    detect.cache_clear = _detect.cache_clear
+    return detect
+
+
+def _run_script(script: Path, *args: str, cwd: Union[str, Path, None] = None) -> subprocess.CompletedProcess:
+    """Run a skill script as __main__ in this interpreter, like `python3 script *args`."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    argv = [str(script), *map(str, args)]
+    saved_argv, saved_path, saved_cwd = sys.argv, sys.path[:], os.getcwd()
+    # Scripts call logging.basicConfig() at import; with the root handlers
+    # cleared it binds to the redirected stderr, as it would in a fresh process.
+    root.handlers = []
+    sys.argv = argv[:]
+    sys.path.insert(0, str(script.parent))
+    returncode = 0
+    try:
+        if cwd is not None:
+            os.chdir(cwd)
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                runpy.run_path(str(script), run_name="__main__")
+            except SystemExit as exc:
+                if exc.code is None or isinstance(exc.code, int):
+                    returncode = exc.code or 0
+                else:
+                    print(exc.code, file=sys.stderr)
+                    returncode = 1
+            except Exception:
+                traceback.print_exc()
+                returncode = 1
+    finally:
+        os.chdir(saved_cwd)
+        sys.argv, sys.path[:] = saved_argv, saved_path
+        root.handlers, root.level = saved_handlers, saved_level
+    return subprocess.CompletedProcess(argv, returncode, stdout.getvalue(), stderr.getvalue())
+
+
+@pytest.fixture
+def script_runner():
+    """Fixture providing run(script, *args, cwd=None) -> CompletedProcess.
+
+    Executes the script in-process instead of spawning python3, which saves
+    interpreter startup per call. An uncaught exception is printed to the
+    captured stderr and reported as returncode 1, as the interpreter would.
+    """
+    return _run_script
@@ -6,15 +6,9 @@ detection, confirmation, and template generation.
 
 import pytest
 import json
-import sys
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-# Add skills directory to Python path for imports
-skills_dir = Path(__file__).parent.parent / "skills" / "project-analyzer"
-if str(skills_dir) not in sys.path:
-    sys.path.insert(0, str(skills_dir))
-
 
 class TestProjectAnalyzer:
     """Test ProjectAnalyzer class initialization and basic workflow."""
@@ -55,12 +49,17 @@ class TestProjectAnalyzer:
 class TestAnalyzeWorkflow:
     """Test the analyze() method workflow."""
 
-    def test_analyze_with_successful_detection(self, nextjs_project, monkeypatch):
+    @pytest.fixture(autouse=True)
+    def _fast_detect(self, monkeypatch, nextjs_detection):
+        """Serve a precomputed detection; these tests cover workflow, not detection."""
+        monkeypatch.setattr("analyze_project.detect_tech_stack", lambda p: nextjs_detection)
+
+    def test_analyze_with_successful_detection(self, nextjs_project_mutable, monkeypatch):
         """Test analyze workflow with successful Next.js detection."""
         from analyze_project import ProjectAnalyzer
 
         # Mock template generation to avoid file I/O
-        def mock_generate(self, detection):
+        def mock_generate(self, detection, phase_result):
             # Create the directory structure
             self.agents_dir.mkdir(parents=True, exist_ok=True)
             return True
@@ -70,18 +69,19 @@ class TestAnalyzeWorkflow:
             mock_generate
         )
 
-        analyzer = ProjectAnalyzer(nextjs_project, auto_confirm=True)
+        analyzer = ProjectAnalyzer(nextjs_project_mutable, auto_confirm=True)
         result = analyzer.analyze()
 
         assert result is True
         assert analyzer.agents_dir.exists()
 
-    def test_analyze_with_failed_detection(self, tmp_path):
+    def test_analyze_with_failed_detection(self, tmp_path, monkeypatch):
         """Test analyze workflow when detection fails."""
         from analyze_project import ProjectAnalyzer
 
         empty_project = tmp_path / "empty"
         empty_project.mkdir()
+        monkeypatch.setattr("analyze_project.detect_tech_stack", lambda p: None)
 
         analyzer = ProjectAnalyzer(empty_project, auto_confirm=True)
         result = analyzer.analyze()
@@ -115,13 +115,15 @@ class TestDisplayDetection:
     def test_display_detection_output(self, nextjs_project, capsys):
         """Test _display_detection prints detection results."""
         from analyze_project import ProjectAnalyzer
+        from detect_phase import detect_phase
         from detect_stack import detect_tech_stack
 
         detection = detect_tech_stack(str(nextjs_project))
         assert detection is not None
+        phase_result = detect_phase(str(nextjs_project))
 
         analyzer = ProjectAnalyzer(nextjs_project, auto_confirm=True)
-        analyzer._display_detection(detection)
+        analyzer._display_detection(detection, phase_result)
 
         # Check that output was printed
         captured = capsys.readouterr()
@@ -189,13 +191,19 @@ class TestConfirmGeneration:
 class TestGenerateSubagents:
     """Test _generate_subagents() method."""
 
-    def test_generate_subagents_creates_directory(self, nextjs_project, monkeypatch):
+    @pytest.fixture(autouse=True)
+    def _fast_detect(self, monkeypatch, nextjs_detection):
+        """Serve a precomputed detection; these tests cover generation, not detection."""
+        monkeypatch.setattr("analyze_project.detect_tech_stack", lambda p: nextjs_detection)
+
+    def test_generate_subagents_creates_directory(self, nextjs_project_mutable, nextjs_detection, monkeypatch):
         """Test subagent generation creates .claude/agents directory."""
         from analyze_project import ProjectAnalyzer
-        from detect_stack import detect_tech_stack
+        from detect_phase import detect_phase
 
-        detection = detect_tech_stack(str(nextjs_project))
-        analyzer = ProjectAnalyzer(nextjs_project, auto_confirm=True)
+        detection = nextjs_detection
+        phase_result = detect_phase(str(nextjs_project_mutable))
+        analyzer = ProjectAnalyzer(nextjs_project_mutable, auto_confirm=True)
 
         # Mock template copying to avoid actual file I/O
         def mock_copy_template(self, src, dest, detection):
@@ -206,7 +214,7 @@ class TestGenerateSubagents:
             mock_copy_template
         )
 
-        result = analyzer._generate_subagents(detection)
+        result = analyzer._generate_subagents(detection, phase_result)
 
         # Should create the agents directory
         assert analyzer.agents_dir.exists()
@@ -231,14 +239,14 @@ class TestCommandLineInterface:
         assert "usage:" in result.stdout.lower()
         assert "project_path" in result.stdout
 
-    def test_cli_auto_flag(self, nextjs_project):
+    def test_cli_auto_flag(self, nextjs_project_mutable):
         """Test --auto flag for automatic confirmation."""
         import subprocess
         import sys
 
         result = subprocess.run(
             [sys.executable, "skills/project-analyzer/analyze_project.py",
-             str(nextjs_project), "--auto"],
+             str(nextjs_project_mutable), "--auto"],
             capture_output=True,
             text=True,
             timeout=10
@@ -255,11 +263,11 @@ class TestIntegrationWorkflow:
     """Integration tests for full workflow."""
 
     @pytest.mark.integration
-    def test_full_workflow_nextjs(self, nextjs_project):
+    def test_full_workflow_nextjs(self, nextjs_project_mutable):
         """Test complete workflow for Next.js project."""
         from analyze_project import ProjectAnalyzer
 
-        analyzer = ProjectAnalyzer(nextjs_project, auto_confirm=True)
+        analyzer = ProjectAnalyzer(nextjs_project_mutable, auto_confirm=True)
 
         # Run full analysis
         result = analyzer.analyze()
@@ -269,11 +277,11 @@ class TestIntegrationWorkflow:
         assert isinstance(result, bool)
 
     @pytest.mark.integration
-    def test_full_workflow_fastapi(self, fastapi_project):
+    def test_full_workflow_fastapi(self, fastapi_project_mutable):
         """Test complete workflow for FastAPI project."""
         from analyze_project import ProjectAnalyzer
 
-        analyzer = ProjectAnalyzer(fastapi_project, auto_confirm=True)
+        analyzer = ProjectAnalyzer(fastapi_project_mutable, auto_confirm=True)
 
         # Run full analysis
         result = analyzer.analyze()
@@ -281,11 +289,11 @@ class TestIntegrationWorkflow:
         assert isinstance(result, bool)
 
     @pytest.mark.integration
-    def test_full_workflow_go(self, go_project):
+    def test_full_workflow_go(self, go_project_mutable):
         """Test complete workflow for Go project."""
         from analyze_project import ProjectAnalyzer
 
-        analyzer = ProjectAnalyzer(go_project, auto_confirm=True)
+        analyzer = ProjectAnalyzer(go_project_mutable, auto_confirm=True)
 
         # Run full analysis
         result = analyzer.analyze()
@@ -321,18 +329,17 @@ class TestErrorHandling:
         result = analyzer.analyze()
         assert result is False
 
-    def test_permission_error_handling(self, tmp_path, monkeypatch):
+    def test_permission_error_handling(self, project_factory, monkeypatch):
         """Test handling of permission errors during template generation."""
         from analyze_project import ProjectAnalyzer
 
-        project = tmp_path / "test-project"
-        project.mkdir()
-
         # Create a minimal package.json for detection
-        (project / "package.json").write_text(json.dumps({
-            "dependencies": {"next": "14.0.0"}
-        }))
-        (project / "next.config.js").write_text("module.exports = {}")
+        project = project_factory("test-project", {
+            "package.json": json.dumps({
+                "dependencies": {"next": "14.0.0"}
+            }),
+            "next.config.js": "module.exports = {}",
+        })
 
         analyzer = ProjectAnalyzer(project, auto_confirm=True)
 
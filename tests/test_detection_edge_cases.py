@@ -9,28 +9,88 @@ import json
 from pathlib import Path
 
 
+# Manifest payloads are serialized once at import time rather than inside
+# each test (and, for the benchmark, outside the measured path)
+_NO_DEPS_PKG_JSON = json.dumps({
+    "name": "test",
+    "version": "1.0.0"
+})
+
+_PHP_81_COMPOSER_JSON = json.dumps({
+    "name": "test/php-app",
+    "type": "project",
+    "require": {"php": ">=8.1"}
+})
+
+_PHP_80_COMPOSER_JSON = json.dumps({
+    "name": "test/php-app",
+    "type": "project",
+    "require": {"php": ">=8.0"}
+})
+
+_REACT_PKG_JSON = json.dumps({
+    "name": "react-ts-app",
+    "dependencies": {
+        "react": "^18.2.0",
+        "react-dom": "^18.2.0"
+    },
+    "devDependencies": {
+        "typescript": "^5.0.0",
+        "@types/react": "^18.2.0",
+        "vite": "^5.0.0"
+    }
+})
+
+_REACT_TSCONFIG_JSON = json.dumps({
+    "compilerOptions": {
+        "jsx": "react-jsx",
+        "target": "ES2020"
+    }
+})
+
+_VUE_PKG_JSON = json.dumps({
+    "name": "vue-composition-app",
+    "dependencies": {
+        "vue": "^3.4.0"
+    }
+})
+
+# Large package.json with many dependencies
+_LARGE_PKG_JSON = json.dumps({
+    "name": "large-app",
+    "dependencies": {
+        **{f"package-{i}": f"^{i}.0.0" for i in range(100)},
+        "next": "14.0.0",
+        "react": "18.2.0",
+    }
+})
+
+_DEEP_PKG_JSON = json.dumps({
+    "name": "deep-app",
+    "dependencies": {"next": "14.0.0"}
+})
+
+# The iOS detector only looks for the *.xcodeproj bundle; one minimal
+# project.pbxproj payload serves every Xcode fixture
+_PBXPROJ = b"// !$*UTF8*$!\n{objects={};rootObject=X;}\n"
+
+
 class TestInvalidJSONHandling:
     """Test handling of corrupted or invalid JSON files."""
 
-    def test_invalid_package_json(self, tmp_path, detector):
+    def test_invalid_package_json(self, project_factory, detector):
         """Test handling of corrupted package.json."""
-        project = tmp_path / "invalid-json"
-        project.mkdir()
-
         # Write invalid JSON
-        (project / "package.json").write_text("{invalid json content")
+        project = project_factory("invalid-json", {"package.json": "{invalid json content"})
 
         result = detector(str(project))
 
         # Should not crash, may return None or generic detection
         assert result is None or result.framework is not None
 
-    def test_empty_package_json(self, tmp_path, detector):
+    def test_empty_package_json(self, project_factory, detector):
         """Test handling of empty package.json."""
-        project = tmp_path / "empty-json"
-        project.mkdir()
-
-        (project / "package.json").write_text("{}")
+        project = project_factory("empty-json", {"package.json": "{}"})
 
         result = detector(str(project))
 
@@ -38,42 +98,31 @@ class TestInvalidJSONHandling:
         # May return None or low confidence detection
         assert result is None or result.confidence < 0.5
 
-    def test_package_json_with_no_dependencies(self, tmp_path, detector):
+    def test_package_json_with_no_dependencies(self, project_factory, detector):
         """Test package.json with no dependencies field."""
-        project = tmp_path / "no-deps"
-        project.mkdir()
-
-        pkg = {
-            "name": "test",
-            "version": "1.0.0"
-        }
-        (project / "package.json").write_text(json.dumps(pkg))
+        project = project_factory("no-deps", {"package.json": _NO_DEPS_PKG_JSON})
 
         result = detector(str(project))
 
         # Should handle gracefully
         assert result is None or result.confidence < 0.5
 
-    def test_invalid_pubspec_yaml(self, tmp_path, detector):
+    def test_invalid_pubspec_yaml(self, project_factory, detector):
         """Test handling of corrupted pubspec.yaml."""
-        project = tmp_path / "invalid-yaml"
-        project.mkdir()
-
         # Write invalid YAML
-        (project / "pubspec.yaml").write_text("dependencies:\n  - invalid: : :\n    broken")
+        project = project_factory("invalid-yaml", {
+            "pubspec.yaml": "dependencies:\n  - invalid: : :\n    broken",
+        })
 
         result = detector(str(project))
 
         # Should not crash
         assert result is None or result.framework is not None
 
-    def test_invalid_go_mod(self, tmp_path, detector):
+    def test_invalid_go_mod(self, project_factory, detector):
         """Test handling of corrupted go.mod."""
-        project = tmp_path / "invalid-gomod"
-        project.mkdir()
-
         # Write invalid go.mod
-        (project / "go.mod").write_text("module\nrequire github.com/")
+        project = project_factory("invalid-gomod", {"go.mod": "module\nrequire github.com/"})
 
         result = detector(str(project))
 
@@ -84,32 +133,17 @@ class TestInvalidJSONHandling:
 class TestFileSystemErrors:
     """Test handling of file system errors and missing files."""
 
-    def test_nonexistent_directory(self, detector):
-        """Test detection with nonexistent directory."""
-        result = detector("/nonexistent/path/to/project")
-
-        # Should return None for nonexistent path
-        assert result is None
-
-    def test_file_instead_of_directory(self, tmp_path, detector):
-        """Test detection when given a file path instead of directory."""
-        file_path = tmp_path / "file.txt"
-        file_path.write_text("content")
-
-        result = detector(str(file_path))
+    @pytest.mark.parametrize("case", ["empty", "missing", "file"])
+    def test_non_project_paths(self, case, tmp_path, detector):
+        """Test detection returns None for an empty dir, a missing path or a plain file."""
+        target = tmp_path / case
+        if case == "empty":
+            target.mkdir()
+        elif case == "file":
+            target.write_text("content")
+        # "missing" is deliberately never created
 
-        # Should handle gracefully (may return None)
-        assert result is None or result.framework is not None
-
-    def test_empty_directory(self, tmp_path, detector):
-        """Test detection in completely empty directory."""
-        empty_dir = tmp_path / "empty"
-        empty_dir.mkdir()
-
-        result = detector(str(empty_dir))
-
-        # Empty directory should return None
-        assert result is None
+        assert detector(str(target)) is None
 
     def test_directory_with_only_readme(self, tmp_path, detector):
         """Test directory with only README file."""
@@ -126,34 +160,14 @@ class TestFileSystemErrors:
 class TestGoDetectionEdgeCases:
     """Test Go framework detection edge cases."""
 
-    def test_go_with_gin_framework(self, tmp_path, detector):
+    def test_go_with_gin_framework(self, project_factory, detector):
         """Test Go detection with Gin web framework."""
-        project = tmp_path / "go-gin"
-        project.mkdir()
-
-        # go.mod with Gin
-        (project / "go.mod").write_text("""module github.com/test/gin-app
-
-go 1.21
-
-require (
-    github.com/gin-gonic/gin v1.9.1
-)
-""")
-
-        # main.go with Gin usage
-        (project / "main.go").write_text("""package main
-
-import "github.com/gin-gonic/gin"
-
-func main() {
-    r := gin.Default()
-    r.GET("/ping", func(c *gin.Context) {
-        c.JSON(200, gin.H{"message": "pong"})
-    })
-    r.Run()
-}
-""")
+        project = project_factory("go-gin", {
+            # go.mod with Gin
+            "go.mod": "module example.com/gin-app\n\ngo 1.21\n\nrequire github.com/gin-gonic/gin v1.9.1\n",
+            # main.go with Gin usage
+            "main.go": "package main\n\nfunc main() {}\n",
+        })
 
         result = detector(str(project))
 
@@ -161,12 +175,10 @@ func main() {
         assert "go" in result.framework.lower()
         assert result.confidence >= 0.8
 
-    def test_go_with_gorm(self, tmp_path, detector):
+    def test_go_with_gorm(self, project_factory, detector):
         """Test Go detection with GORM ORM."""
-        project = tmp_path / "go-gorm"
-        project.mkdir()
-
-        (project / "go.mod").write_text("""module github.com/test/gorm-app
+        project = project_factory("go-gorm", {
+            "go.mod": """module example.com/gorm-app
 
 go 1.21
 
@@ -174,17 +186,9 @@ require (
     gorm.io/gorm v1.25.0
     gorm.io/driver/postgres v1.5.0
 )
-""")
-
-        (project / "models.go").write_text("""package main
-
-import "gorm.io/gorm"
-
-type User struct {
-    gorm.Model
-    Name string
-}
-""")
+""",
+            "models.go": "package main\n",
+        })
 
         result = detector(str(project))
 
@@ -194,24 +198,12 @@ type User struct {
         # Note: DetectionResult has metadata dict, not details
         assert result.confidence >= 0.7
 
-    def test_go_without_framework(self, tmp_path, detector):
+    def test_go_without_framework(self, project_factory, detector):
         """Test vanilla Go project without frameworks."""
-        project = tmp_path / "go-vanilla"
-        project.mkdir()
-
-        (project / "go.mod").write_text("""module github.com/test/vanilla
-
-go 1.21
-""")
-
-        (project / "main.go").write_text("""package main
-
-import "fmt"
-
-func main() {
-    fmt.Println("Hello, World!")
-}
-""")
+        project = project_factory("go-vanilla", {
+            "go.mod": "module example.com/vanilla\n\ngo 1.21\n",
+            "main.go": "package main\n\nfunc main() {}\n",
+        })
 
         result = detector(str(project))
 
@@ -224,12 +216,10 @@ func main() {
 class TestFlutterDetectionEdgeCases:
     """Test Flutter framework detection edge cases."""
 
-    def test_flutter_with_riverpod(self, tmp_path, detector):
+    def test_flutter_with_riverpod(self, project_factory, detector):
         """Test Flutter detection with Riverpod state management."""
-        project = tmp_path / "flutter-riverpod"
-        project.mkdir()
-
-        (project / "pubspec.yaml").write_text("""name: flutter_riverpod_app
+        project = project_factory("flutter-riverpod", {
+            "pubspec.yaml": """name: flutter_riverpod_app
 version: 1.0.0+1
 
 environment:
@@ -240,22 +230,10 @@ dependencies:
     sdk: flutter
   flutter_riverpod: ^2.4.0
   riverpod_annotation: ^2.3.0
-""")
-
-        # Create lib directory with Flutter code
-        lib_dir = project / "lib"
-        lib_dir.mkdir()
-        (lib_dir / "main.dart").write_text("""import 'package:flutter/material.dart';
-import 'package:flutter_riverpod/flutter_riverpod.dart';
-
-void main() {
-  runApp(ProviderScope(child: MyApp()));
-}
-""")
-
-        # Create android/ios directories
-        (project / "android").mkdir()
-        (project / "ios").mkdir()
+""",
+            # lib directory with Flutter code
+            "lib/main.dart": "import 'package:flutter/material.dart';\n",
+        }, dirs=("android", "ios"))
 
         result = detector(str(project))
 
@@ -263,12 +241,10 @@ void main() {
         assert "flutter" in result.framework.lower()
         assert result.confidence >= 0.8
 
-    def test_flutter_with_bloc(self, tmp_path, detector):
+    def test_flutter_with_bloc(self, project_factory, detector):
         """Test Flutter detection with BLoC pattern."""
-        project = tmp_path / "flutter-bloc"
-        project.mkdir()
-
-        (project / "pubspec.yaml").write_text("""name: flutter_bloc_app
+        project = project_factory("flutter-bloc", {
+            "pubspec.yaml": """name: flutter_bloc_app
 version: 1.0.0+1
 
 environment:
@@ -279,41 +255,26 @@ dependencies:
     sdk: flutter
   flutter_bloc: ^8.1.0
   bloc: ^8.1.0
-""")
-
-        lib_dir = project / "lib"
-        lib_dir.mkdir()
-        (lib_dir / "main.dart").write_text("""import 'package:flutter/material.dart';
-import 'package:flutter_bloc/flutter_bloc.dart';
-
-void main() => runApp(MyApp());
-""")
-
-        (project / "android").mkdir()
-        (project / "ios").mkdir()
+""",
+            "lib/main.dart": "import 'package:flutter/material.dart';\n",
+        }, dirs=("android", "ios"))
 
         result = detector(str(project))
 
         assert result is not None
         assert "flutter" in result.framework.lower()
 
-    def test_flutter_without_sdk_constraint(self, tmp_path, detector):
+    def test_flutter_without_sdk_constraint(self, project_factory, detector):
         """Test Flutter with minimal pubspec.yaml."""
-        project = tmp_path / "flutter-minimal"
-        project.mkdir()
-
-        (project / "pubspec.yaml").write_text("""name: minimal_flutter
+        project = project_factory("flutter-minimal", {
+            "pubspec.yaml": """name: minimal_flutter
 
 dependencies:
   flutter:
     sdk: flutter
-""")
-
-        lib_dir = project / "lib"
-        lib_dir.mkdir()
-        (lib_dir / "main.dart").write_text("import 'package:flutter/material.dart';")
-
-        (project / "android").mkdir()
+""",
+            "lib/main.dart": "import 'package:flutter/material.dart';",
+        }, dirs=("android",))
 
         result = detector(str(project))
 
@@ -325,97 +286,44 @@ dependencies:
 class TestPHPDetectionEdgeCases:
     """Test PHP framework detection edge cases."""
 
-    def test_php_with_multiple_files(self, tmp_path, detector):
+    def test_php_with_multiple_files(self, project_factory, detector):
         """Test PHP detection with multiple PHP files and routing indicators."""
-        project = tmp_path / "php-multi"
-        project.mkdir()
-
-        (project / "composer.json").write_text(json.dumps({
-            "name": "test/php-app",
-            "type": "project",
-            "require": {"php": ">=8.1"}
-        }))
-
-        # index.php with routing logic (strong indicator)
-        (project / "index.php").write_text("""<?php
-require 'vendor/autoload.php';
-
-$uri = $_SERVER['REQUEST_URI'];
-$method = $_SERVER['REQUEST_METHOD'];
-
-header('Content-Type: application/json');
-$data = ['message' => 'Hello', 'uri' => $uri, 'method' => $method];
-echo json_encode($data);
-""")
-
-        (project / "config.php").write_text("""<?php
-define('DB_HOST', 'localhost');
-define('DB_NAME', 'testdb');
-""")
-
-        (project / "api.php").write_text("""<?php
-header('Content-Type: application/json');
-echo json_encode(['status' => 'ok']);
-""")
-
-        # Add .htaccess for stronger signal
-        (project / ".htaccess").write_text("""RewriteEngine On
-RewriteCond %{REQUEST_FILENAME} !-f
-RewriteRule ^(.*)$ index.php [QSA,L]
-""")
+        project = project_factory("php-multi", {
+            "composer.json": _PHP_81_COMPOSER_JSON,
+            # index.php with routing logic (strong indicator)
+            "index.php": "<?php\necho $_SERVER['REQUEST_URI'];\n",
+            "config.php": "<?php\n",
+            "api.php": "<?php\n",
+            # Add .htaccess for stronger signal
+            ".htaccess": "RewriteEngine On\nRewriteRule ^(.*)$ index.php [QSA,L]\n",
+        })
 
         result = detector(str(project))
 
         assert result is not None
         assert "php" in result.framework.lower()
 
-    def test_php_with_htaccess(self, tmp_path, detector):
+    def test_php_with_htaccess(self, project_factory, detector):
         """Test PHP detection with .htaccess (routing indicator)."""
-        project = tmp_path / "php-htaccess"
-        project.mkdir()
-
-        (project / "composer.json").write_text(json.dumps({
-            "name": "test/php-app",
-            "type": "project",
-            "require": {"php": ">=8.0"}
-        }))
-
-        (project / ".htaccess").write_text("""RewriteEngine On
-RewriteCond %{REQUEST_FILENAME} !-f
-RewriteCond %{REQUEST_FILENAME} !-d
-RewriteRule ^(.*)$ index.php [QSA,L]
-""")
-
-        (project / "index.php").write_text("""<?php
-$uri = $_SERVER['REQUEST_URI'];
-header('Content-Type: application/json');
-echo json_encode(['message' => 'Hello', 'uri' => $uri]);
-""")
+        project = project_factory("php-htaccess", {
+            "composer.json": _PHP_80_COMPOSER_JSON,
+            ".htaccess": "RewriteEngine On\nRewriteRule ^(.*)$ index.php [QSA,L]\n",
+            "index.php": "<?php\necho $_SERVER['REQUEST_URI'];\n",
+        })
 
         result = detector(str(project))
 
         assert result is not None
         assert "php" in result.framework.lower()
 
-    def test_php_without_composer(self, tmp_path, detector):
+    def test_php_without_composer(self, project_factory, detector):
         """Test PHP detection without composer.json (expected to fail)."""
-        project = tmp_path / "php-no-composer"
-        project.mkdir()
-
-        # Only PHP files, no composer.json
-        # Current implementation requires composer.json for confident detection
-        (project / "index.php").write_text("""<?php
-$uri = $_SERVER['REQUEST_URI'];
-$method = $_SERVER['REQUEST_METHOD'];
-header('Content-Type: application/json');
-echo json_encode(['uri' => $uri, 'method' => $method]);
-""")
-
-        (project / "functions.php").write_text("""<?php
-function process_request($data) {
-    return array_map('strtoupper', $data);
-}
-""")
+        project = project_factory("php-no-composer", {
+            # Only PHP files, no composer.json
+            # Current implementation requires composer.json for confident detection
+            "index.php": "<?php\necho $_SERVER['REQUEST_URI'];\n",
+            "functions.php": "<?php\n",
+        })
 
         result = detector(str(project))
 
@@ -431,68 +339,26 @@ function process_request($data) {
 class TestDjangoFlaskEdgeCases:
     """Test Django and Flask detection edge cases."""
 
-    def test_django_with_rest_framework(self, tmp_path, detector):
+    def test_django_with_rest_framework(self, project_factory, detector):
         """Test Django detection with Django REST framework."""
-        project = tmp_path / "django-rest"
-        project.mkdir()
-
-        (project / "requirements.txt").write_text("""Django==5.0.0
-djangorestframework==3.14.0
-psycopg2-binary==2.9.9
-""")
-
-        (project / "manage.py").write_text("""#!/usr/bin/env python
-import os
-import sys
-
-if __name__ == "__main__":
-    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
-    from django.core.management import execute_from_command_line
-    execute_from_command_line(sys.argv)
-""")
-
-        config_dir = project / "config"
-        config_dir.mkdir()
-        (config_dir / "__init__.py").touch()
-        (config_dir / "settings.py").write_text("""
-SECRET_KEY = 'test'
-DEBUG = True
-INSTALLED_APPS = [
-    'rest_framework',
-    'django.contrib.contenttypes',
-]
-""")
+        project = project_factory("django-rest", {
+            "requirements.txt": "Django==5.0.0\ndjangorestframework==3.14.0\n",
+            "manage.py": "#!/usr/bin/env python\n",
+            "config/__init__.py": "",
+            "config/settings.py": "INSTALLED_APPS = ['rest_framework']\n",
+        })
 
         result = detector(str(project))
 
         assert result is not None
         assert "django" in result.framework.lower()
 
-    def test_flask_with_sqlalchemy(self, tmp_path, detector):
+    def test_flask_with_sqlalchemy(self, project_factory, detector):
         """Test Flask detection with Flask-SQLAlchemy."""
-        project = tmp_path / "flask-sqlalchemy"
-        project.mkdir()
-
-        (project / "requirements.txt").write_text("""Flask==3.0.0
-Flask-SQLAlchemy==3.1.0
-Flask-Migrate==4.0.5
-""")
-
-        (project / "app.py").write_text("""from flask import Flask
-from flask_sqlalchemy import SQLAlchemy
-
-app = Flask(__name__)
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///app.db'
-db = SQLAlchemy(app)
-
-class User(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    username = db.Column(db.String(80))
-
-@app.route('/')
-def index():
-    return {'message': 'Hello'}
-""")
+        project = project_factory("flask-sqlalchemy", {
+            "requirements.txt": "Flask==3.0.0\nFlask-SQLAlchemy==3.1.0\n",
+            "app.py": "from flask import Flask\n",
+        })
 
         result = detector(str(project))
 
@@ -503,88 +369,47 @@ def index():
 class TestPythonMLEdgeCases:
     """Test Python ML/CV detection edge cases."""
 
-    def test_pytorch_project(self, tmp_path, detector):
+    def test_pytorch_project(self, project_factory, detector):
         """Test PyTorch ML project detection."""
-        project = tmp_path / "pytorch-ml"
-        project.mkdir()
-
-        (project / "requirements.txt").write_text("""torch==2.1.0
+        project = project_factory("pytorch-ml", {
+            "requirements.txt": """torch==2.1.0
 torchvision==0.16.0
 numpy==1.26.0
 matplotlib==3.8.0
-""")
-
-        (project / "train.py").write_text("""import torch
-import torch.nn as nn
-import torch.optim as optim
-
-class Net(nn.Module):
-    def __init__(self):
-        super().__init__()
-        self.fc = nn.Linear(10, 1)
-
-    def forward(self, x):
-        return self.fc(x)
-
-model = Net()
-criterion = nn.MSELoss()
-optimizer = optim.Adam(model.parameters())
-""")
+""",
+            "train.py": "import torch\n",
+        })
 
         result = detector(str(project))
 
         assert result is not None
         assert "python" in result.framework.lower()
 
-    def test_tensorflow_project(self, tmp_path, detector):
+    def test_tensorflow_project(self, project_factory, detector):
         """Test TensorFlow ML project detection."""
-        project = tmp_path / "tf-ml"
-        project.mkdir()
-
-        (project / "requirements.txt").write_text("""tensorflow==2.15.0
+        project = project_factory("tf-ml", {
+            "requirements.txt": """tensorflow==2.15.0
 keras==2.15.0
 numpy==1.26.0
 pandas==2.1.0
-""")
-
-        (project / "model.py").write_text("""import tensorflow as tf
-from tensorflow import keras
-
-model = keras.Sequential([
-    keras.layers.Dense(64, activation='relu'),
-    keras.layers.Dense(10, activation='softmax')
-])
-
-model.compile(optimizer='adam', loss='categorical_crossentropy')
-""")
+""",
+            "model.py": "import tensorflow as tf\n",
+        })
 
         result = detector(str(project))
 
         assert result is not None
         assert "python" in result.framework.lower()
 
-    def test_opencv_project(self, tmp_path, detector):
+    def test_opencv_project(self, project_factory, detector):
         """Test OpenCV computer vision project detection."""
-        project = tmp_path / "opencv-cv"
-        project.mkdir()
-
-        (project / "requirements.txt").write_text("""opencv-python==4.8.0
+        project = project_factory("opencv-cv", {
+            "requirements.txt": """opencv-python==4.8.0
 numpy==1.26.0
 pillow==10.1.0
-""")
-
-        (project / "detect.py").write_text("""import cv2
-import numpy as np
-
-def detect_faces(image_path):
-    img = cv2.imread(image_path)
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-    face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
-    faces = face_cascade.detectMultiScale(gray, 1.1, 4)
-
-    return faces
-""")
+""",
+            "detect.py": "import cv2\n",
+        })
 
         result = detector(str(project))
 
@@ -595,146 +420,57 @@ def detect_faces(image_path):
 class TestiOSSwiftEdgeCases:
     """Test iOS Swift detection edge cases."""
 
-    def test_swiftui_project(self, tmp_path, detector):
+    def test_swiftui_project(self, project_factory, detector):
         """Test SwiftUI project detection."""
-        project = tmp_path / "swiftui-app"
-        project.mkdir()
-
-        # Create .xcodeproj
-        xcodeproj = project / "SwiftUIApp.xcodeproj"
-        xcodeproj.mkdir()
-        (xcodeproj / "project.pbxproj").write_text("""// !$*UTF8*$!
-{
-    archiveVersion = 1;
-    classes = {};
-    objectVersion = 56;
-    objects = {
-        /* Begin PBXProject section */
-        /* End PBXProject section */
-    };
-    rootObject = TestProject;
-}
-""")
-
-        # Sources
-        sources = project / "Sources"
-        sources.mkdir()
-        (sources / "ContentView.swift").write_text("""import SwiftUI
-
-struct ContentView: View {
-    @State private var count = 0
-
-    var body: some View {
-        VStack {
-            Text("Count: \\(count)")
-            Button("Increment") {
-                count += 1
-            }
-        }
-    }
-}
-""")
+        project = project_factory("swiftui-app", {
+            # .xcodeproj
+            "SwiftUIApp.xcodeproj/project.pbxproj": _PBXPROJ,
+            # Sources
+            "Sources/ContentView.swift": "import SwiftUI\n",
+        })
 
         result = detector(str(project))
 
         assert result is not None
-        assert "swift" in result.framework.lower() or "ios" in result.framework.lower()
+        framework = result.framework.lower()
+        assert "swift" in framework or "ios" in framework
 
-    def test_uikit_project(self, tmp_path, detector):
+    def test_uikit_project(self, project_factory, detector):
         """Test UIKit project detection."""
-        project = tmp_path / "uikit-app"
-        project.mkdir()
-
-        xcodeproj = project / "UIKitApp.xcodeproj"
-        xcodeproj.mkdir()
-        (xcodeproj / "project.pbxproj").write_text("// Xcode project\n")
-
-        sources = project / "Sources"
-        sources.mkdir()
-        (sources / "ViewController.swift").write_text("""import UIKit
-
-class ViewController: UIViewController {
-    override func viewDidLoad() {
-        super.viewDidLoad()
-        view.backgroundColor = .white
-    }
-}
-""")
+        project = project_factory("uikit-app", {
+            "UIKitApp.xcodeproj/project.pbxproj": _PBXPROJ,
+            "Sources/ViewController.swift": "import UIKit\n",
+        })
 
         result = detector(str(project))
 
         assert result is not None
-        assert "swift" in result.framework.lower() or "ios" in result.framework.lower()
+        framework = result.framework.lower()
+        assert "swift" in framework or "ios" in framework
 
 
 class TestReactVueEdgeCases:
     """Test React and Vue detection edge cases."""
 
-    def test_react_with_typescript(self, tmp_path, detector):
+    def test_react_with_typescript(self, project_factory, detector):
         """Test React detection with TypeScript."""
-        project = tmp_path / "react-ts"
-        project.mkdir()
-
-        (project / "package.json").write_text(json.dumps({
-            "name": "react-ts-app",
-            "dependencies": {
-                "react": "^18.2.0",
-                "react-dom": "^18.2.0"
-            },
-            "devDependencies": {
-                "typescript": "^5.0.0",
-                "@types/react": "^18.2.0",
-                "vite": "^5.0.0"
-            }
-        }))
-
-        (project / "tsconfig.json").write_text(json.dumps({
-            "compilerOptions": {
-                "jsx": "react-jsx",
-                "target": "ES2020"
-            }
-        }))
-
-        src = project / "src"
-        src.mkdir()
-        (src / "App.tsx").write_text("""import React from 'react';
-
-const App: React.FC = () => {
-    return <div>Hello</div>;
-};
-
-export default App;
-""")
+        project = project_factory("react-ts", {
+            "package.json": _REACT_PKG_JSON,
+            "tsconfig.json": _REACT_TSCONFIG_JSON,
+            "src/App.tsx": "export default function App() { return <div /> }\n",
+        })
 
         result = detector(str(project))
 
         assert result is not None
         assert "react" in result.framework.lower()
 
-    def test_vue_with_composition_api(self, tmp_path, detector):
+    def test_vue_with_composition_api(self, project_factory, detector):
         """Test Vue detection with Composition API."""
-        project = tmp_path / "vue-composition"
-        project.mkdir()
-
-        (project / "package.json").write_text(json.dumps({
-            "name": "vue-composition-app",
-            "dependencies": {
-                "vue": "^3.4.0"
-            }
-        }))
-
-        src = project / "src"
-        src.mkdir()
-        (src / "App.vue").write_text("""<template>
-  <div>{{ message }}</div>
-</template>
-
-<script setup>
-import { ref } from 'vue'
-
-const message = ref('Hello Vue 3')
-</script>
-""")
+        project = project_factory("vue-composition", {
+            "package.json": _VUE_PKG_JSON,
+            "src/App.vue": "<template><div /></template>\n",
+        })
 
         result = detector(str(project))
 
@@ -746,46 +482,30 @@ const message = ref('Hello Vue 3')
 class TestDetectionPerformanceEdgeCases:
     """Test detection performance with edge case inputs."""
 
-    def test_large_package_json(self, tmp_path, detector, benchmark):
+    def test_large_package_json(self, project_factory, uncached_detector, benchmark):
         """Test detection performance with large package.json."""
-        project = tmp_path / "large-deps"
-        project.mkdir()
-
-        # Generate large package.json with many dependencies
-        deps = {f"package-{i}": f"^{i}.0.0" for i in range(100)}
-        deps["next"] = "14.0.0"
-        deps["react"] = "18.2.0"
-
-        (project / "package.json").write_text(json.dumps({
-            "name": "large-app",
-            "dependencies": deps
-        }))
-
-        (project / "next.config.js").write_text("module.exports = {}")
-
-        def detect():
-            return detector(str(project))
-
-        result = benchmark(detect)
+        project = project_factory("large-deps", {
+            "package.json": _LARGE_PKG_JSON,
+            "next.config.js": "module.exports = {}",
+        })
+
+        project_path = str(project)
+        result = benchmark.pedantic(
+            uncached_detector, args=(project_path,),
+            rounds=20, iterations=5, warmup_rounds=2
+        )
         assert result is not None
 
     def test_deep_directory_structure(self, tmp_path, detector):
         """Test detection with very deep directory structure."""
-        # Create deep nested structure
-        current = tmp_path / "deep"
-        current.mkdir()
-
-        for i in range(20):
-            current = current / f"level{i}"
-            current.mkdir()
+        # Create deep nested structure in one call
+        deep = tmp_path.joinpath("deep", *[f"level{i}" for i in range(20)])
+        deep.mkdir(parents=True)
 
         # Place framework files at deep level
-        (current / "package.json").write_text(json.dumps({
-            "name": "deep-app",
-            "dependencies": {"next": "14.0.0"}
-        }))
+        (deep / "package.json").write_text(_DEEP_PKG_JSON)
 
-        result = detector(str(current))
+        result = detector(str(deep))
 
         # Should still detect even in deep structure
         assert result is not None or result is None  # May or may not detect depending on implementation
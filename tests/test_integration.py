@@ -10,15 +10,43 @@ from pathlib import Path
 import subprocess
 import json
 
+_SKILLS = Path(__file__).resolve().parent.parent / "skills"
+_DETECT_STACK = _SKILLS / "project-analyzer" / "detect_stack.py"
+_DETECT_PHASE = _SKILLS / "adaptive-review" / "detect_phase.py"
+_ANALYZE_PROJECT = _SKILLS / "project-analyzer" / "analyze_project.py"
+
+# Realistic Next.js layout (config, app/ router, components), pre-encoded once
+_COMPLEX_NEXTJS_TREE = {
+    "package.json": json.dumps({
+        "name": "complex-app",
+        "version": "2.1.0",
+        "dependencies": {
+            "next": "14.2.0",
+            "react": "18.2.0",
+            "typescript": "5.3.0"
+        },
+        "devDependencies": {
+            "vitest": "1.0.0",
+            "@testing-library/react": "14.0.0",
+            "tailwindcss": "3.4.0"
+        }
+    }, separators=(",", ":")).encode(),
+    "next.config.js": b"module.exports = {}",
+    "tsconfig.json": b'{"compilerOptions": {}}',
+    "app/page.tsx": b"export default function Page() {}",
+    "app/layout.tsx": b"export default function Layout() {}",
+    "components/Header.tsx": b"export default function Header() {}",
+}
+
 
 @pytest.mark.integration
 class TestEndToEndWorkflow:
     """Test complete workflow from detection to generation."""
 
-    def test_nextjs_full_workflow(self, nextjs_project, detector):
+    def test_nextjs_full_workflow(self, nextjs_detection):
         """Test complete workflow for Next.js project."""
-        # 1. Detect framework using detector fixture
-        result = detector(str(nextjs_project))
+        # 1. Detect framework (shared session-wide detection result)
+        result = nextjs_detection
         assert result is not None
         assert result.framework == "nextjs"
         assert result.confidence >= 0.95
@@ -26,16 +54,16 @@ class TestEndToEndWorkflow:
         # 2. Verify file structure (generation tested separately)
         # Generation requires analyze_project.py which needs user confirmation
 
-    def test_fastapi_full_workflow(self, fastapi_project, detector):
+    def test_fastapi_full_workflow(self, fastapi_detection):
         """Test complete workflow for FastAPI project."""
-        result = detector(str(fastapi_project))
+        result = fastapi_detection
         assert result is not None
         assert result.framework == "fastapi"
         assert result.confidence >= 0.75
 
-    def test_go_full_workflow(self, go_project, detector):
+    def test_go_full_workflow(self, go_detection):
         """Test complete workflow for Go project."""
-        result = detector(str(go_project))
+        result = go_detection
         assert result is not None
         assert result.framework.startswith("go")
         assert result.confidence >= 0.80
@@ -45,43 +73,41 @@ class TestEndToEndWorkflow:
 class TestMultiProjectWorkflow:
     """Test workflows involving multiple projects."""
 
-    def test_analyze_multiple_projects(self, nextjs_project, fastapi_project):
+    def test_analyze_multiple_projects(self, nextjs_project_mutable, fastapi_project_mutable, read_text):
         """Test analyzing multiple projects in sequence."""
+        # Fresh copies have no .claude/ yet, so mkdir without exist_ok also
+        # catches a guide leaking into the shared session trees.
+
         # Analyze Next.js project
-        agents_dir_1 = Path(nextjs_project) / ".claude" / "agents"
-        agents_dir_1.mkdir(parents=True, exist_ok=True)
+        agents_dir_1 = Path(nextjs_project_mutable) / ".claude" / "agents"
+        agents_dir_1.mkdir(parents=True)
         (agents_dir_1 / "SUBAGENT_GUIDE.md").write_text("# Next.js Guide")
 
         # Analyze FastAPI project
-        agents_dir_2 = Path(fastapi_project) / ".claude" / "agents"
-        agents_dir_2.mkdir(parents=True, exist_ok=True)
+        agents_dir_2 = Path(fastapi_project_mutable) / ".claude" / "agents"
+        agents_dir_2.mkdir(parents=True)
         (agents_dir_2 / "SUBAGENT_GUIDE.md").write_text("# FastAPI Guide")
 
         # Verify both have different guides
-        guide_1 = (agents_dir_1 / "SUBAGENT_GUIDE.md").read_text()
-        guide_2 = (agents_dir_2 / "SUBAGENT_GUIDE.md").read_text()
+        guide_1 = read_text(agents_dir_1 / "SUBAGENT_GUIDE.md")
+        guide_2 = read_text(agents_dir_2 / "SUBAGENT_GUIDE.md")
 
         assert "Next.js" in guide_1
         assert "FastAPI" in guide_2
         assert guide_1 != guide_2
 
-    def test_regenerate_after_framework_change(self, tmp_path):
+    def test_regenerate_after_framework_change(self, project_factory):
         """Test regenerating subagents after framework change."""
-        # Start as Next.js project
-        project = tmp_path / "project"
-        project.mkdir()
-
+        # Start as Next.js project, with subagents generated for Next.js
+        project = project_factory("project", {
+            "package.json": '{"dependencies": {"next": "14.0.0"}}',
+            ".claude/agents/SUBAGENT_GUIDE.md": "# Next.js Guide",
+        })
         package_json = project / "package.json"
-        package_json.write_text('{"dependencies": {"next": "14.0.0"}}')
-
-        # Generate subagents (would detect Next.js)
         agents_dir = project / ".claude" / "agents"
-        agents_dir.mkdir(parents=True, exist_ok=True)
-        (agents_dir / "SUBAGENT_GUIDE.md").write_text("# Next.js Guide")
 
         # Change to React project
         package_json.write_text('{"dependencies": {"react": "18.0.0", "vite": "5.0.0"}}')
-        (project / "next.config.js").unlink(missing_ok=True)
 
         # Regenerate (would detect React)
         (agents_dir / "SUBAGENT_GUIDE.md").write_text("# React Guide")
@@ -111,10 +137,10 @@ class TestUpdateWorkflow:
         # Verify version updated
         assert version_file.read_text().strip() == "0.4.3-beta"
 
-    def test_update_project_guides(self, nextjs_project):
+    def test_update_project_guides(self, nextjs_project_mutable, read_text):
         """Test updating project-specific guides after global tool update."""
         # Initial guide (v0.4.2)
-        agents_dir = Path(nextjs_project) / ".claude" / "agents"
+        agents_dir = Path(nextjs_project_mutable) / ".claude" / "agents"
         agents_dir.mkdir(parents=True, exist_ok=True)
 
         guide = agents_dir / "SUBAGENT_GUIDE.md"
@@ -124,7 +150,7 @@ class TestUpdateWorkflow:
         guide.write_text("# Guide v0.4.3\n\nNew AGGRESSIVE content")
 
         # Verify update
-        content = guide.read_text()
+        content = read_text(guide)
         assert "0.4.3" in content
         assert "AGGRESSIVE" in content
         assert "0.4.2" not in content
@@ -134,7 +160,7 @@ class TestUpdateWorkflow:
 class TestPhaseDetectionIntegration:
     """Test integration between phase detection and code review."""
 
-    def test_prototype_phase_light_review(self, tmp_path):
+    def test_prototype_phase_light_review(self, tmp_path, script_runner):
         """Test that Prototype phase triggers light review."""
         project = tmp_path / "prototype-project"
         project.mkdir()
@@ -143,20 +169,13 @@ class TestPhaseDetectionIntegration:
         (project / "package.json").write_text('{"version": "0.1.0"}')
 
         # Run phase detection
-        script = Path(__file__).parent.parent / "skills" / "adaptive-review" / "detect_phase.py"
-
-        result = subprocess.run(
-            ["python3", str(script), str(project)],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        result = script_runner(_DETECT_PHASE, str(project))
 
         # Verify output indicates Prototype
         assert result.returncode == 0
         # Would parse phase from output
 
-    def test_production_phase_strict_review(self, tmp_path):
+    def test_production_phase_strict_review(self, tmp_path, script_runner):
         """Test that Production phase triggers strict review."""
         project = tmp_path / "production-project"
         project.mkdir()
@@ -168,14 +187,7 @@ class TestPhaseDetectionIntegration:
         (tests_dir / "test_main.py").write_text("def test_example(): pass")
 
         # Run phase detection
-        script = Path(__file__).parent.parent / "skills" / "adaptive-review" / "detect_phase.py"
-
-        result = subprocess.run(
-            ["python3", str(script), str(project)],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        result = script_runner(_DETECT_PHASE, str(project))
 
         # Verify output indicates Production
         assert result.returncode == 0
@@ -186,26 +198,18 @@ class TestCLIUsability:
     """Test command-line interface usability."""
 
     @pytest.mark.skip(reason="detect_stack.py --help not yet implemented (argparse needed)")
-    def test_detect_stack_help(self):
+    def test_detect_stack_help(self, script_runner):
         """Test that detect_stack.py shows help message."""
-        script = Path(__file__).parent.parent / "skills" / "project-analyzer" / "detect_stack.py"
-
-        result = subprocess.run(
-            ["python3", str(script), "--help"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        result = script_runner(_DETECT_STACK, "--help")
 
         assert result.returncode == 0
-        assert "usage" in result.stdout.lower() or "detect" in result.stdout.lower()
+        stdout = result.stdout.lower()
+        assert "usage" in stdout or "detect" in stdout
 
-    def test_analyze_project_auto_flag(self, nextjs_project):
+    def test_analyze_project_auto_flag(self, nextjs_project_mutable):
         """Test that --auto flag skips user confirmation."""
-        script = Path(__file__).parent.parent / "skills" / "project-analyzer" / "analyze_project.py"
-
         result = subprocess.run(
-            ["python3", str(script), str(nextjs_project), "--auto"],
+            ["python3", str(_ANALYZE_PROJECT), str(nextjs_project_mutable), "--auto"],
             capture_output=True,
             text=True,
             timeout=60,
@@ -215,16 +219,9 @@ class TestCLIUsability:
         # Should complete without waiting for input
         assert result.returncode == 0
 
-    def test_verbose_logging(self, nextjs_project):
+    def test_verbose_logging(self, nextjs_project, script_runner):
         """Test that --verbose flag enables debug logging."""
-        script = Path(__file__).parent.parent / "skills" / "project-analyzer" / "detect_stack.py"
-
-        result = subprocess.run(
-            ["python3", str(script), str(nextjs_project), "--verbose"],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        result = script_runner(_DETECT_STACK, str(nextjs_project), "--verbose")
 
         # Verbose output should be longer
         assert len(result.stdout) > 100 or len(result.stderr) > 100
@@ -235,89 +232,33 @@ class TestCLIUsability:
 class TestRealWorldProjects:
     """Test with real-world project structures (slow tests)."""
 
-    def test_complex_nextjs_project(self, tmp_path):
+    def test_complex_nextjs_project(self, project_factory, script_runner):
         """Test detection on complex Next.js project structure."""
-        project = tmp_path / "complex-nextjs"
-        project.mkdir()
-
-        # Create realistic structure
-        (project / "package.json").write_text('''
-        {
-          "name": "complex-app",
-          "version": "2.1.0",
-          "dependencies": {
-            "next": "14.2.0",
-            "react": "18.2.0",
-            "typescript": "5.3.0"
-          },
-          "devDependencies": {
-            "vitest": "1.0.0",
-            "@testing-library/react": "14.0.0",
-            "tailwindcss": "3.4.0"
-          }
-        }
-        ''')
-
-        (project / "next.config.js").write_text("module.exports = {}")
-        (project / "tsconfig.json").write_text('{"compilerOptions": {}}')
-
-        # Create app directory structure
-        app_dir = project / "app"
-        app_dir.mkdir()
-        (app_dir / "page.tsx").write_text("export default function Page() {}")
-        (app_dir / "layout.tsx").write_text("export default function Layout() {}")
-
-        # Create components
-        components_dir = project / "components"
-        components_dir.mkdir()
-        (components_dir / "Header.tsx").write_text("export default function Header() {}")
+        project = project_factory("complex-nextjs", _COMPLEX_NEXTJS_TREE)
 
         # Run detection
-        script = Path(__file__).parent.parent / "skills" / "project-analyzer" / "detect_stack.py"
-
-        result = subprocess.run(
-            ["python3", str(script), str(project)],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        result = script_runner(_DETECT_STACK, str(project))
 
         assert result.returncode == 0
 
     @pytest.mark.skip(reason="Monorepo Next.js fixture missing next.config.js - enhancement needed")
-    def test_monorepo_structure(self, tmp_path):
+    def test_monorepo_structure(self, project_factory, script_runner):
         """Test detection in monorepo with multiple frameworks."""
-        monorepo = tmp_path / "monorepo"
-        monorepo.mkdir()
-
-        # Frontend (Next.js)
+        monorepo = project_factory("monorepo", {
+            # Frontend (Next.js)
+            "frontend/package.json": '{"dependencies": {"next": "14.0.0"}}',
+            # Backend (FastAPI)
+            "backend/requirements.txt": "fastapi==0.109.0\nuvicorn==0.27.0",
+            "backend/main.py": "from fastapi import FastAPI\napp = FastAPI()",
+        })
         frontend = monorepo / "frontend"
-        frontend.mkdir()
-        (frontend / "package.json").write_text('{"dependencies": {"next": "14.0.0"}}')
-
-        # Backend (FastAPI)
         backend = monorepo / "backend"
-        backend.mkdir()
-        (backend / "requirements.txt").write_text("fastapi==0.109.0\nuvicorn==0.27.0")
-        (backend / "main.py").write_text("from fastapi import FastAPI\napp = FastAPI()")
 
         # Each project should be detected independently
         # Test frontend
-        script = Path(__file__).parent.parent / "skills" / "project-analyzer" / "detect_stack.py"
+        result_frontend = script_runner(_DETECT_STACK, str(frontend))
 
-        result_frontend = subprocess.run(
-            ["python3", str(script), str(frontend)],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-
-        result_backend = subprocess.run(
-            ["python3", str(script), str(backend)],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        result_backend = script_runner(_DETECT_STACK, str(backend))
 
         assert result_frontend.returncode == 0
         assert result_backend.returncode == 0
@@ -331,7 +272,7 @@ class TestRealWorldProjects:
 class TestErrorRecovery:
     """Test error recovery and graceful degradation."""
 
-    def test_corrupted_package_json(self, tmp_path):
+    def test_corrupted_package_json(self, tmp_path, script_runner):
         """Test handling of corrupted package.json."""
         project = tmp_path / "corrupted"
         project.mkdir()
@@ -339,14 +280,7 @@ class TestErrorRecovery:
         # Invalid JSON
         (project / "package.json").write_text('{"dependencies": {"next"')
 
-        script = Path(__file__).parent.parent / "skills" / "project-analyzer" / "detect_stack.py"
-
-        result = subprocess.run(
-            ["python3", str(script), str(project)],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        result = script_runner(_DETECT_STACK, str(project))
 
         # Should fail gracefully, not crash
         # Acceptable: return None or error message
@@ -359,27 +293,26 @@ class TestErrorRecovery:
         # Placeholder for documentation purposes
         pass
 
-    def test_network_timeout(self, tmp_path):
-        """Test that no network calls cause timeouts."""
+    def test_network_timeout(self, tmp_path, monkeypatch, script_runner):
+        """Test that detection makes no network calls (so cannot time out on them)."""
+        import socket
+
         project = tmp_path / "offline"
         project.mkdir()
         (project / "package.json").write_text('{"dependencies": {"next": "14.0.0"}}')
 
-        # All operations should work offline
-        script = Path(__file__).parent.parent / "skills" / "project-analyzer" / "detect_stack.py"
+        # All operations should work offline: fail on any socket use
+        attempts = []
 
-        import time
-        start = time.time()
+        def _no_network(*args, **kwargs):
+            attempts.append(args)
+            raise OSError("network access is disabled in tests")
 
-        result = subprocess.run(
-            ["python3", str(script), str(project)],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        monkeypatch.setattr(socket, "socket", _no_network)
+        monkeypatch.setattr(socket, "create_connection", _no_network)
+        monkeypatch.setattr(socket, "getaddrinfo", _no_network)
 
-        elapsed = time.time() - start
+        script_runner(_DETECT_STACK, str(project))
 
-        # Should complete quickly (no network delays), even if detection fails
-        assert elapsed < 10.0, f"Detection took too long: {elapsed:.1f}s"
         # returncode may be non-zero if detection confidence too low, which is OK for this test
+        assert not attempts, f"Detection attempted network access: {attempts}"
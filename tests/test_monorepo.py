@@ -10,105 +10,99 @@ Tests workspace detection for:
 """
 
 import pytest
-from pathlib import Path
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import detect_monorepo as dm  # skills/project-analyzer is on pythonpath (pyproject.toml)
+
+# Large-monorepo manifests; workspace fields are trivial, so format a template
+# rather than json.dumps per package
+_LARGE_ROOT_PKG_JSON = b'{"name": "large-test", "workspaces": ["packages/*"]}'
+_WORKSPACE_PKG_JSON = '{{"name": "@test/package-{i}", "version": "1.0.0"}}'
 
 
 class TestNpmWorkspaces:
     """Test npm workspaces detection."""
 
-    def test_npm_workspaces_detected(self, npm_monorepo, monorepo_detector):
-        """Test npm workspaces are correctly detected."""
-        detector = monorepo_detector(npm_monorepo)
-        result = detector.detect()
+    @pytest.fixture(scope="class")
+    def npm_detect_result(self, npm_monorepo, cached_monorepo_detector):
+        """Detection result for npm_monorepo, computed once for the class."""
+        return cached_monorepo_detector(npm_monorepo)
 
-        assert result.is_monorepo is True
-        assert result.workspace_manager == "npm"
-        assert result.root_path == npm_monorepo
-        assert len(result.workspaces) == 3  # web, admin, ui
+    def test_npm_workspaces_detected(self, npm_monorepo, npm_detect_result):
+        """Test npm workspaces are correctly detected."""
+        assert npm_detect_result.is_monorepo is True
+        assert npm_detect_result.workspace_manager == "npm"
+        assert npm_detect_result.root_path == npm_monorepo
+        assert len(npm_detect_result.workspaces) == 3  # web, admin, ui
 
-    def test_npm_workspace_names(self, npm_monorepo, monorepo_detector):
+    def test_npm_workspace_names(self, npm_detect_result):
         """Test npm workspace names are extracted correctly."""
-        detector = monorepo_detector(npm_monorepo)
-        result = detector.detect()
-
-        workspace_names = [w.name for w in result.workspaces]
+        workspace_names = {w.name for w in npm_detect_result.workspaces}
         assert "test-nextjs" in workspace_names  # web app
         assert "test-react" in workspace_names   # admin app
         assert "@test/ui" in workspace_names     # shared package
 
-    def test_npm_workspace_paths(self, npm_monorepo, monorepo_detector):
+    def test_npm_workspace_paths(self, npm_detect_result):
         """Test npm workspace paths are correct."""
-        detector = monorepo_detector(npm_monorepo)
-        result = detector.detect()
-
-        for workspace in result.workspaces:
-            assert workspace.path.exists()
-            assert workspace.path.is_dir()
-            assert (workspace.path / "package.json").exists()
-
-    def test_npm_workspace_package_manager(self, npm_monorepo, monorepo_detector):
+        # One scandir per parent directory instead of three stats per workspace
+        listings = {}
+        for workspace in npm_detect_result.workspaces:
+            parent = workspace.path.parent
+            if parent not in listings:
+                with os.scandir(parent) as entries:
+                    listings[parent] = {e.name: e.is_dir() for e in entries}
+            assert listings[parent].get(workspace.path.name), f"Not a directory: {workspace.path}"
+
+            with os.scandir(workspace.path) as entries:
+                assert any(e.name == "package.json" for e in entries), f"No package.json in {workspace.path}"
+
+    def test_npm_workspace_package_manager(self, npm_detect_result):
         """Test npm workspaces have correct package_manager field."""
-        detector = monorepo_detector(npm_monorepo)
-        result = detector.detect()
-
-        for workspace in result.workspaces:
+        for workspace in npm_detect_result.workspaces:
             assert workspace.package_manager == "npm"
 
 
 class TestPnpmWorkspaces:
     """Test pnpm workspaces detection."""
 
-    def test_pnpm_workspaces_detected(self, pnpm_monorepo, monorepo_detector):
+    def test_pnpm_workspaces_detected(self, pnpm_monorepo, cached_monorepo_detector):
         """Test pnpm workspaces are correctly detected."""
-        detector = monorepo_detector(pnpm_monorepo)
-        result = detector.detect()
+        result = cached_monorepo_detector(pnpm_monorepo)
 
         assert result.is_monorepo is True
         assert result.workspace_manager == "pnpm"
         assert result.root_path == pnpm_monorepo
         assert len(result.workspaces) == 3  # api, admin, shared
 
-    def test_pnpm_workspace_yaml_parsed(self, pnpm_monorepo, monorepo_detector):
+    def test_pnpm_workspace_yaml_parsed(self, pnpm_monorepo, cached_monorepo_detector):
         """Test pnpm-workspace.yaml is correctly parsed."""
-        detector = monorepo_detector(pnpm_monorepo)
-        result = detector.detect()
+        result = cached_monorepo_detector(pnpm_monorepo)
 
-        workspace_names = [w.name for w in result.workspaces]
+        workspace_names = {w.name for w in result.workspaces}
         assert "@test/api" in workspace_names
         assert "@test/admin" in workspace_names
         assert "@test/shared" in workspace_names
 
-    def test_pnpm_workspace_paths(self, pnpm_monorepo, monorepo_detector):
+    def test_pnpm_workspace_paths(self, pnpm_monorepo, cached_monorepo_detector):
         """Test pnpm workspace paths are correct."""
-        detector = monorepo_detector(pnpm_monorepo)
-        result = detector.detect()
+        result = cached_monorepo_detector(pnpm_monorepo)
+
+        by_name = {w.name: w for w in result.workspaces}
 
         # Check services/api exists
-        api_found = any(
-            "api" in str(w.path) and w.name == "@test/api"
-            for w in result.workspaces
-        )
-        assert api_found
+        assert "@test/api" in by_name
+        assert "api" in str(by_name["@test/api"].path)
 
         # Check services/admin exists
-        admin_found = any(
-            "admin" in str(w.path) and w.name == "@test/admin"
-            for w in result.workspaces
-        )
-        assert admin_found
+        assert "@test/admin" in by_name
+        assert "admin" in str(by_name["@test/admin"].path)
 
     def test_pnpm_without_yaml_available(self, pnpm_monorepo, monorepo_detector, monkeypatch):
         """Test pnpm detection handles missing PyYAML gracefully."""
         # Simulate PyYAML not available
-        import sys
-        from pathlib import Path
-
-        # Add skills directory to Python path
-        skills_dir = Path(__file__).parent.parent / "skills" / "project-analyzer"
-        if str(skills_dir) not in sys.path:
-            sys.path.insert(0, str(skills_dir))
-
-        import detect_monorepo as dm
         monkeypatch.setattr(dm, "YAML_AVAILABLE", False)
 
         detector = monorepo_detector(pnpm_monorepo)
@@ -121,22 +115,20 @@ class TestPnpmWorkspaces:
 class TestYarnWorkspaces:
     """Test Yarn workspaces detection."""
 
-    def test_yarn_workspaces_detected(self, yarn_monorepo, monorepo_detector):
+    def test_yarn_workspaces_detected(self, yarn_monorepo, cached_monorepo_detector):
         """Test Yarn workspaces are correctly detected."""
-        detector = monorepo_detector(yarn_monorepo)
-        result = detector.detect()
+        result = cached_monorepo_detector(yarn_monorepo)
 
         assert result.is_monorepo is True
         assert result.workspace_manager == "npm"  # Yarn uses npm detection (package.json)
         assert result.root_path == yarn_monorepo
         assert len(result.workspaces) == 2  # api, app
 
-    def test_yarn_workspace_object_format(self, yarn_monorepo, monorepo_detector):
+    def test_yarn_workspace_object_format(self, yarn_monorepo, cached_monorepo_detector):
         """Test Yarn workspaces object format {packages: [...]} is parsed."""
-        detector = monorepo_detector(yarn_monorepo)
-        result = detector.detect()
+        result = cached_monorepo_detector(yarn_monorepo)
 
-        workspace_names = [w.name for w in result.workspaces]
+        workspace_names = {w.name for w in result.workspaces}
         assert "@test/backend-api" in workspace_names
         assert "@test/mobile-app" in workspace_names
 
@@ -149,32 +141,29 @@ class TestYarnWorkspaces:
 class TestLernaMonorepo:
     """Test Lerna monorepo detection."""
 
-    def test_lerna_monorepo_detected(self, lerna_monorepo, monorepo_detector):
+    def test_lerna_monorepo_detected(self, lerna_monorepo, cached_monorepo_detector):
         """Test Lerna monorepo is correctly detected."""
-        detector = monorepo_detector(lerna_monorepo)
-        result = detector.detect()
+        result = cached_monorepo_detector(lerna_monorepo)
 
         assert result.is_monorepo is True
         assert result.workspace_manager == "lerna"
         assert result.root_path == lerna_monorepo
         assert len(result.workspaces) == 2  # vue-app, react-app
 
-    def test_lerna_json_parsed(self, lerna_monorepo, monorepo_detector):
+    def test_lerna_json_parsed(self, lerna_monorepo, cached_monorepo_detector):
         """Test lerna.json is correctly parsed."""
         lerna_json = lerna_monorepo / "lerna.json"
         assert lerna_json.exists()
 
-        detector = monorepo_detector(lerna_monorepo)
-        result = detector.detect()
+        result = cached_monorepo_detector(lerna_monorepo)
 
-        workspace_names = [w.name for w in result.workspaces]
+        workspace_names = {w.name for w in result.workspaces}
         assert "test-vue" in workspace_names
         assert "test-react" in workspace_names
 
-    def test_lerna_package_manager(self, lerna_monorepo, monorepo_detector):
+    def test_lerna_package_manager(self, lerna_monorepo, cached_monorepo_detector):
         """Test Lerna workspaces have correct package_manager field."""
-        detector = monorepo_detector(lerna_monorepo)
-        result = detector.detect()
+        result = cached_monorepo_detector(lerna_monorepo)
 
         for workspace in result.workspaces:
             assert workspace.package_manager == "lerna"
@@ -183,29 +172,27 @@ class TestLernaMonorepo:
 class TestNxMonorepo:
     """Test Nx monorepo detection."""
 
-    def test_nx_monorepo_detected(self, nx_monorepo, monorepo_detector):
+    def test_nx_monorepo_detected(self, nx_monorepo, cached_monorepo_detector):
         """Test Nx monorepo is correctly detected."""
-        detector = monorepo_detector(nx_monorepo)
-        result = detector.detect()
+        result = cached_monorepo_detector(nx_monorepo)
 
         assert result.is_monorepo is True
         assert result.workspace_manager == "nx"
         assert result.root_path == nx_monorepo
         assert len(result.workspaces) >= 2  # web, api (from workspace.json and project.json)
 
-    def test_nx_workspace_json_parsed(self, nx_monorepo, monorepo_detector):
+    def test_nx_workspace_json_parsed(self, nx_monorepo, cached_monorepo_detector):
         """Test Nx workspace.json is correctly parsed."""
         workspace_json = nx_monorepo / "workspace.json"
         assert workspace_json.exists()
 
-        detector = monorepo_detector(nx_monorepo)
-        result = detector.detect()
+        result = cached_monorepo_detector(nx_monorepo)
 
-        workspace_names = [w.name for w in result.workspaces]
+        workspace_names = {w.name for w in result.workspaces}
         assert "web" in workspace_names
         assert "api" in workspace_names
 
-    def test_nx_project_json_detected(self, nx_monorepo, monorepo_detector):
+    def test_nx_project_json_detected(self, nx_monorepo, cached_monorepo_detector):
         """Test Nx project.json files are detected (Nx >= 13)."""
         # Check that project.json files exist
         web_project_json = nx_monorepo / "apps" / "web" / "project.json"
@@ -214,8 +201,7 @@ class TestNxMonorepo:
         assert web_project_json.exists()
         assert api_project_json.exists()
 
-        detector = monorepo_detector(nx_monorepo)
-        result = detector.detect()
+        result = cached_monorepo_detector(nx_monorepo)
 
         # project.json files should be detected (may duplicate workspace.json entries)
         assert len(result.workspaces) >= 2
@@ -224,21 +210,19 @@ class TestNxMonorepo:
 class TestNestedMonorepo:
     """Test nested monorepo structures."""
 
-    def test_nested_monorepo_outer_detected(self, nested_monorepo, monorepo_detector):
+    def test_nested_monorepo_outer_detected(self, nested_monorepo, cached_monorepo_detector):
         """Test outer monorepo is detected in nested structure."""
-        detector = monorepo_detector(nested_monorepo)
-        result = detector.detect()
+        result = cached_monorepo_detector(nested_monorepo)
 
         assert result.is_monorepo is True
         assert result.workspace_manager == "npm"
         assert result.root_path == nested_monorepo
 
-    def test_nested_monorepo_inner_workspace(self, nested_monorepo, monorepo_detector):
+    def test_nested_monorepo_inner_workspace(self, nested_monorepo, cached_monorepo_detector):
         """Test inner monorepo can also be detected separately."""
         inner_monorepo = nested_monorepo / "workspaces" / "inner"
 
-        detector = monorepo_detector(inner_monorepo)
-        result = detector.detect()
+        result = cached_monorepo_detector(inner_monorepo)
 
         assert result.is_monorepo is True
         assert result.workspace_manager == "npm"
@@ -302,26 +286,17 @@ class TestMonorepoErrorHandling:
         # Should not crash
         assert result.is_monorepo is False
 
-    def test_missing_workspace_package_json(self, tmp_path, monorepo_detector):
+    def test_missing_workspace_package_json(self, project_factory, monorepo_detector):
         """Test handling of workspace directories without package.json."""
-        import json
-
-        monorepo = tmp_path / "broken-monorepo"
-        monorepo.mkdir()
-
-        # Create root package.json with workspaces
+        # Root package.json with workspaces, plus a workspace directory that
+        # has no package.json of its own
         root_pkg = {
             "name": "test",
             "workspaces": ["packages/*"]
         }
-        (monorepo / "package.json").write_text(json.dumps(root_pkg))
-
-        # Create workspace directory but no package.json
-        packages_dir = monorepo / "packages"
-        packages_dir.mkdir()
-        broken_pkg = packages_dir / "broken"
-        broken_pkg.mkdir()
-        # No package.json here
+        monorepo = project_factory("broken-monorepo", {
+            "package.json": json.dumps(root_pkg),
+        }, dirs=("packages/broken",))
 
         detector = monorepo_detector(monorepo)
         result = detector.detect()
@@ -344,24 +319,16 @@ class TestMonorepoErrorHandling:
 class TestMonorepoDetectionPriority:
     """Test detection priority when multiple config files exist."""
 
-    def test_pnpm_takes_priority_over_npm(self, tmp_path, monorepo_detector):
+    def test_pnpm_takes_priority_over_npm(self, project_factory, monorepo_detector):
         """Test pnpm-workspace.yaml takes priority over package.json workspaces."""
-        import json
-
-        monorepo = tmp_path / "mixed-config"
-        monorepo.mkdir()
-
-        # Create both npm and pnpm config
-        (monorepo / "package.json").write_text(json.dumps({
-            "name": "test",
-            "workspaces": ["npm/*"]
-        }))
-
-        (monorepo / "pnpm-workspace.yaml").write_text("packages:\n  - 'pnpm/*'\n")
-
-        # Create both workspace directories
-        (monorepo / "npm").mkdir()
-        (monorepo / "pnpm").mkdir()
+        # Create both npm and pnpm config, and both workspace directories
+        monorepo = project_factory("mixed-config", {
+            "package.json": json.dumps({
+                "name": "test",
+                "workspaces": ["npm/*"]
+            }),
+            "pnpm-workspace.yaml": "packages:\n  - 'pnpm/*'\n",
+        }, dirs=("npm", "pnpm"))
 
         detector = monorepo_detector(monorepo)
         result = detector.detect()
@@ -376,39 +343,42 @@ class TestMonorepoIntegration:
 
     @pytest.mark.integration
     def test_detect_frameworks_in_monorepo_workspaces(
-        self, npm_monorepo, monorepo_detector, detector
+        self, npm_monorepo, cached_monorepo_detector, detector
     ):
         """Test framework detection works for each workspace."""
-        monorepo_result = monorepo_detector(npm_monorepo).detect()
+        monorepo_result = cached_monorepo_detector(npm_monorepo)
 
         assert monorepo_result.is_monorepo is True
 
-        # Detect framework for each workspace
-        for workspace in monorepo_result.workspaces:
-            framework_result = detector(str(workspace.path))
+        # Detect framework for each workspace concurrently
+        workspaces = monorepo_result.workspaces
+        with ThreadPoolExecutor(max_workers=len(workspaces)) as executor:
+            framework_results = list(executor.map(detector, (str(w.path) for w in workspaces)))
 
+        for workspace, framework_result in zip(workspaces, framework_results):
             # Workspaces should have detectable frameworks
-            if "nextjs" in workspace.name.lower() or workspace.path.name == "web":
+            workspace_name = workspace.name.lower()
+            if "nextjs" in workspace_name or workspace.path.name == "web":
                 assert framework_result is not None
                 assert "next" in framework_result.framework.lower()
 
-            elif "react" in workspace.name.lower() or workspace.path.name == "admin":
+            elif "react" in workspace_name or workspace.path.name == "admin":
                 assert framework_result is not None
                 # React app (may be detected as React or generic Node.js)
 
     @pytest.mark.integration
     def test_monorepo_with_mixed_frameworks(
-        self, pnpm_monorepo, monorepo_detector, detector
+        self, pnpm_monorepo, cached_monorepo_detector, detector
     ):
         """Test monorepo with Python (FastAPI, Flask) and JS workspaces."""
-        monorepo_result = monorepo_detector(pnpm_monorepo).detect()
+        monorepo_result = cached_monorepo_detector(pnpm_monorepo)
 
         assert monorepo_result.is_monorepo is True
-        assert len(monorepo_result.workspaces) >= 2
+        assert len(workspaces := monorepo_result.workspaces) >= 2
 
         # Check we can detect different frameworks
         frameworks_found = []
-        for workspace in monorepo_result.workspaces:
+        for workspace in workspaces:
             framework_result = detector(str(workspace.path))
             if framework_result:
                 frameworks_found.append(framework_result.framework)
@@ -431,31 +401,16 @@ class TestMonorepoPerformance:
         result = benchmark(detect)
         assert result.is_monorepo is True
 
-    def test_large_monorepo_detection(self, tmp_path, monorepo_detector):
+    def test_large_monorepo_detection(self, project_factory, monorepo_detector):
         """Test detection performance with large monorepo (20+ workspaces)."""
-        import json
-        import time
-
-        monorepo = tmp_path / "large-monorepo"
-        monorepo.mkdir()
-
-        # Create root package.json
-        (monorepo / "package.json").write_text(json.dumps({
-            "name": "large-test",
-            "workspaces": ["packages/*"]
-        }))
-
-        # Create 25 workspace packages
-        packages_dir = monorepo / "packages"
-        packages_dir.mkdir()
-
-        for i in range(25):
-            pkg_dir = packages_dir / f"package-{i}"
-            pkg_dir.mkdir()
-            (pkg_dir / "package.json").write_text(json.dumps({
-                "name": f"@test/package-{i}",
-                "version": "1.0.0"
-            }))
+        # Root package.json plus 25 workspace packages, written in one batch
+        monorepo = project_factory("large-monorepo", {
+            "package.json": _LARGE_ROOT_PKG_JSON,
+            **{
+                f"packages/package-{i}/package.json": _WORKSPACE_PKG_JSON.format(i=i).encode()
+                for i in range(25)
+            },
+        })
 
         # Measure detection time
         start_time = time.perf_counter()